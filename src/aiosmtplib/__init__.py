@@ -10,7 +10,7 @@ The Dragon De Monsyne <dragondm@integral.org>
 Author: Cole Maclean <hi@colemaclean.dev>
 """
 
-from .api import send
+from .api import clear_ssl_context_cache, send
 from .errors import (
     SMTPAuthenticationError,
     SMTPConnectError,
@@ -28,6 +28,7 @@ from .errors import (
     SMTPTimeoutError,
     SMTPConnectResponseError,
 )
+from .pool import SMTPConnectionPool
 from .response import SMTPResponse
 from .smtp import SMTP
 from .typing import SMTPStatus
@@ -40,7 +41,9 @@ __license__ = "MIT"
 __copyright__ = "Copyright 2022 Cole Maclean"
 __all__ = (
     "send",
+    "clear_ssl_context_cache",
     "SMTP",
+    "SMTPConnectionPool",
     "SMTPResponse",
     "SMTPStatus",
     "SMTPAuthenticationError",
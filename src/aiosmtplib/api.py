@@ -3,17 +3,62 @@ Main public API.
 """
 
 import email.message
+import functools
+import os
 import socket
 import ssl
 from collections.abc import Sequence
 from typing import Optional, Union, cast
 
+from .errors import SMTPRecipientsRefused, SMTPResponseException
+from .pool import SMTPConnectionPool
 from .response import SMTPResponse
-from .smtp import DEFAULT_TIMEOUT, SMTP
+from .smtp import DEFAULT_TIMEOUT, SMTP, build_tls_context
 from .typing import SocketPathType
 
 
-__all__ = ("send",)
+__all__ = ("send", "clear_ssl_context_cache")
+
+
+def _get_mtime(path: Optional[str]) -> Optional[int]:
+    if path is None:
+        return None
+
+    return os.stat(path).st_mtime_ns
+
+
+@functools.lru_cache(maxsize=32)
+def _get_cached_tls_context(
+    validate_certs: bool,
+    client_cert: Optional[str],
+    client_key: Optional[str],
+    cert_bundle: Optional[str],
+    mtimes: tuple[Optional[int], ...],
+) -> ssl.SSLContext:
+    # mtimes are only part of the cache key, so that changed files are reloaded
+    return build_tls_context(
+        validate_certs=validate_certs,
+        client_cert=client_cert,
+        client_key=client_key,
+        cert_bundle=cert_bundle,
+    )
+
+
+def _check_raw_message_args(
+    sender: Optional[str], recipients: Optional[Union[str, Sequence[str]]]
+) -> None:
+    if not recipients:
+        raise ValueError("Recipients must be provided with raw messages.")
+    if not sender:
+        raise ValueError("Sender must be provided with raw messages.")
+
+
+def clear_ssl_context_cache() -> None:
+    """
+    Clear the cache of TLS contexts built by :func:`send` from
+    ``client_cert``, ``client_key`` and ``cert_bundle`` paths.
+    """
+    _get_cached_tls_context.cache_clear()
 
 
 async def send(
@@ -40,6 +85,7 @@ async def send(
     cert_bundle: Optional[str] = None,
     socket_path: Optional[SocketPathType] = None,
     sock: Optional[socket.socket] = None,
+    pool: Optional[SMTPConnectionPool] = None,
 ) -> tuple[dict[str, SMTPResponse], str]:
     """
     Send an email message. On await, connects to the SMTP server using the details
@@ -88,19 +134,87 @@ async def send(
         hostname or port. Accepts str, bytes, or a pathlike object.
     :keyword sock: An existing, connected socket object. If given, none of
         hostname, port, or socket_path should be provided.
+    :keyword pool: An :class:`.SMTPConnectionPool` to take the connection from.
+        If given, the connection is returned to the pool after sending, instead
+        of being closed. Not compatible with ``sock``.
 
     :raises ValueError: required arguments missing or mutually exclusive options
         provided
     """
-    if not isinstance(message, (email.message.EmailMessage, email.message.Message)):
-        if not recipients:
-            raise ValueError("Recipients must be provided with raw messages.")
-        if not sender:
-            raise ValueError("Sender must be provided with raw messages.")
+    # Check for raw str/bytes first, so they skip the isinstance check
+    message_type = type(message)
+    is_message = (
+        message_type is not bytes
+        and message_type is not str
+        and isinstance(message, email.message.Message)
+    )
+    if not is_message:
+        _check_raw_message_args(sender, recipients)
 
     sender = cast(str, sender)
     recipients = cast(Union[str, Sequence[str]], recipients)
 
+    # Loading certificates is expensive, so reuse contexts between calls.
+    # With opportunistic STARTTLS, leave loading to the client, as the
+    # certificates are only needed if the server supports it.
+    if (
+        tls_context is None
+        and (use_tls or start_tls is True)
+        and (client_cert is not None or cert_bundle is not None)
+    ):
+        mtimes = (
+            _get_mtime(client_cert),
+            _get_mtime(client_key),
+            _get_mtime(cert_bundle),
+        )
+        tls_context = _get_cached_tls_context(
+            validate_certs, client_cert, client_key, cert_bundle, mtimes
+        )
+        client_cert = client_key = cert_bundle = None
+
+    if pool is not None:
+        if sock is not None:
+            raise ValueError("The sock option is not compatible with pool")
+
+        client = await pool.acquire(
+            hostname=hostname,
+            port=port,
+            username=username,
+            password=password,
+            local_hostname=local_hostname,
+            source_address=source_address,
+            timeout=timeout,
+            use_tls=use_tls,
+            start_tls=start_tls,
+            validate_certs=validate_certs,
+            client_cert=client_cert,
+            client_key=client_key,
+            tls_context=tls_context,
+            cert_bundle=cert_bundle,
+            socket_path=socket_path,
+        )
+        try:
+            result = await _send_with_client(
+                client,
+                message,
+                is_message=is_message,
+                sender=sender,
+                recipients=recipients,
+                mail_options=mail_options,
+                rcpt_options=rcpt_options,
+            )
+        except (SMTPResponseException, SMTPRecipientsRefused):
+            # The server responded, so the connection can be reset and reused
+            await pool.release(client)
+            raise
+        except BaseException:
+            await pool.release(client, discard=True)
+            raise
+
+        await pool.release(client)
+
+        return result
+
     client = SMTP(
         hostname=hostname,
         port=port,
@@ -121,21 +235,41 @@ async def send(
     )
 
     async with client:
-        if isinstance(message, (email.message.EmailMessage, email.message.Message)):
-            result = await client.send_message(
-                message,
-                sender=sender,
-                recipients=recipients,
-                mail_options=mail_options,
-                rcpt_options=rcpt_options,
-            )
-        else:
-            result = await client.sendmail(
-                sender,
-                recipients,
-                message,
-                mail_options=mail_options,
-                rcpt_options=rcpt_options,
-            )
+        return await _send_with_client(
+            client,
+            message,
+            is_message=is_message,
+            sender=sender,
+            recipients=recipients,
+            mail_options=mail_options,
+            rcpt_options=rcpt_options,
+        )
+
 
-    return result
+async def _send_with_client(
+    client: SMTP,
+    message: Union[email.message.EmailMessage, email.message.Message, str, bytes],
+    /,
+    *,
+    is_message: bool,
+    sender: str,
+    recipients: Union[str, Sequence[str]],
+    mail_options: Optional[Sequence[str]],
+    rcpt_options: Optional[Sequence[str]],
+) -> tuple[dict[str, SMTPResponse], str]:
+    if is_message:
+        return await client.send_message(
+            cast(email.message.Message, message),
+            sender=sender,
+            recipients=recipients,
+            mail_options=mail_options,
+            rcpt_options=rcpt_options,
+        )
+
+    return await client.sendmail(
+        sender,
+        recipients,
+        cast(Union[str, bytes], message),
+        mail_options=mail_options,
+        rcpt_options=rcpt_options,
+    )
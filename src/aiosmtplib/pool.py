@@ -0,0 +1,191 @@
+"""
+Connection pooling for sending multiple messages.
+"""
+
+import ssl
+from typing import Any, Optional, Union
+
+from .errors import SMTPException
+from .smtp import DEFAULT_TIMEOUT, SMTP
+from .typing import SocketPathType
+
+
+__all__ = ("SMTPConnectionPool",)
+
+PoolKey = tuple[Any, ...]
+
+
+class SMTPConnectionPool:
+    """
+    Keeps connected :class:`.SMTP` clients open between uses, so that sending
+    several messages to the same server only connects (and does TLS, EHLO and
+    login) once.
+
+    Clients are pooled by their connection options. Between uses the server
+    state is reset with RSET, rather than disconnecting with QUIT.
+
+    Pass a pool to :func:`aiosmtplib.send` using the ``pool`` keyword argument,
+    or acquire and release clients directly:
+
+        >>> pool = aiosmtplib.SMTPConnectionPool()
+        >>> async def send_with_pool():
+        ...     client = await pool.acquire(hostname="127.0.0.1", port=1025)
+        ...     try:
+        ...         return await client.sendmail(
+        ...             "root@localhost", ["somebody@localhost"], "Hello"
+        ...         )
+        ...     finally:
+        ...         await pool.release(client)
+        ...         await pool.close()
+        >>> asyncio.run(send_with_pool())
+        ({}, 'OK')
+    """
+
+    def __init__(self, *, max_idle: int = 10) -> None:
+        """
+        :keyword max_idle: Maximum number of idle connections kept open per set
+            of connection options. Clients released beyond this limit are
+            disconnected.
+        """
+        if max_idle < 1:
+            raise ValueError("max_idle must be at least 1")
+
+        self.max_idle = max_idle
+        self._idle_clients: dict[PoolKey, list[SMTP]] = {}
+        self._client_keys: dict[SMTP, PoolKey] = {}
+
+    async def __aenter__(self) -> "SMTPConnectionPool":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.close()
+
+    async def acquire(
+        self,
+        *,
+        hostname: Optional[str] = "localhost",
+        port: Optional[int] = None,
+        username: Optional[Union[str, bytes]] = None,
+        password: Optional[Union[str, bytes]] = None,
+        local_hostname: Optional[str] = None,
+        source_address: Optional[tuple[str, int]] = None,
+        timeout: Optional[float] = DEFAULT_TIMEOUT,
+        use_tls: bool = False,
+        start_tls: Optional[bool] = None,
+        validate_certs: bool = True,
+        client_cert: Optional[str] = None,
+        client_key: Optional[str] = None,
+        tls_context: Optional[ssl.SSLContext] = None,
+        cert_bundle: Optional[str] = None,
+        socket_path: Optional[SocketPathType] = None,
+    ) -> SMTP:
+        """
+        Return a connected client for the options given, reusing an idle
+        connection if one is available. Keyword arguments are the same as for
+        :class:`.SMTP`.
+
+        Clients must be returned with :meth:`release` when done.
+        """
+        key: PoolKey = (
+            hostname,
+            port,
+            username,
+            password,
+            local_hostname,
+            source_address,
+            timeout,
+            use_tls,
+            start_tls,
+            validate_certs,
+            client_cert,
+            client_key,
+            id(tls_context) if tls_context is not None else None,
+            cert_bundle,
+            socket_path,
+        )
+
+        idle_clients = self._idle_clients.get(key)
+        while idle_clients:
+            client = idle_clients.pop()
+            if client.is_connected:
+                return client
+
+            del self._client_keys[client]
+
+        client = SMTP(
+            hostname=hostname,
+            port=port,
+            username=username,
+            password=password,
+            local_hostname=local_hostname,
+            source_address=source_address,
+            timeout=timeout,
+            use_tls=use_tls,
+            start_tls=start_tls,
+            validate_certs=validate_certs,
+            client_cert=client_cert,
+            client_key=client_key,
+            tls_context=tls_context,
+            cert_bundle=cert_bundle,
+            socket_path=socket_path,
+        )
+        await client.connect()
+        self._client_keys[client] = key
+
+        return client
+
+    async def release(self, client: SMTP, /, *, discard: bool = False) -> None:
+        """
+        Return a client acquired from this pool. If the connection is still
+        usable, it is reset and kept open for reuse.
+
+        :keyword discard: Close the connection instead of reusing it. Use this
+            if the last command failed without a server response (e.g. on
+            timeout or cancellation), as the connection state is unknown.
+        """
+        key = self._client_keys.get(client)
+        if key is None:
+            raise ValueError("Client was not acquired from this pool")
+
+        if discard:
+            del self._client_keys[client]
+            client.close()
+            return
+
+        if client.is_connected:
+            try:
+                await client.rset()
+            except SMTPException:
+                client.close()
+
+        idle_clients = self._idle_clients.get(key, [])
+        if client.is_connected and len(idle_clients) < self.max_idle:
+            self._idle_clients.setdefault(key, idle_clients).append(client)
+            return
+
+        del self._client_keys[client]
+        await self._disconnect(client)
+
+    async def close(self) -> None:
+        """
+        Disconnect all idle clients.
+        """
+        clients = [
+            client
+            for idle_clients in self._idle_clients.values()
+            for client in idle_clients
+        ]
+        self._idle_clients.clear()
+
+        for client in clients:
+            del self._client_keys[client]
+            await self._disconnect(client)
+
+    async def _disconnect(self, client: SMTP) -> None:
+        if not client.is_connected:
+            return
+
+        try:
+            await client.quit()
+        except SMTPException:
+            client.close()
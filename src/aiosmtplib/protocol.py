@@ -41,7 +41,7 @@ class FlowControlMixin(asyncio.Protocol):
 
     def __init__(self, loop: Optional[asyncio.AbstractEventLoop] = None):
         if loop is None:
-            self._loop = asyncio.get_event_loop()
+            self._loop = asyncio.get_running_loop()
         else:
             self._loop = loop
 
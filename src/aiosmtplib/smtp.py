@@ -53,6 +53,33 @@ SMTP_STARTTLS_PORT = 587
 DEFAULT_TIMEOUT = 60
 
 
+def build_tls_context(
+    *,
+    validate_certs: bool = True,
+    client_cert: Optional[str] = None,
+    client_key: Optional[str] = None,
+    cert_bundle: Optional[str] = None,
+) -> ssl.SSLContext:
+    """
+    Build a client side SSLContext object from the TLS options given.
+    """
+    # SERVER_AUTH is what we want for a client side socket
+    context = ssl.create_default_context(ssl.Purpose.SERVER_AUTH)
+    context.check_hostname = bool(validate_certs)
+    if validate_certs:
+        context.verify_mode = ssl.CERT_REQUIRED
+    else:
+        context.verify_mode = ssl.CERT_NONE
+
+    if cert_bundle is not None:
+        context.load_verify_locations(cafile=cert_bundle)
+
+    if client_cert is not None:
+        context.load_cert_chain(client_cert, keyfile=client_key)
+
+    return context
+
+
 class SMTP:
     """
     Main SMTP client class.
@@ -161,7 +188,6 @@ class SMTP:
         self.sock = sock
         self.source_address = source_address
 
-        self.loop: Optional[asyncio.AbstractEventLoop] = None
         self._connect_lock: Optional[asyncio.Lock] = None
         self.last_helo_response: Optional[SMTPResponse] = None
         self._last_ehlo_response: Optional[SMTPResponse] = None
@@ -420,7 +446,6 @@ class SMTP:
         )
         self._validate_config()
 
-        self.loop = asyncio.get_running_loop()
         if self._connect_lock is None:
             self._connect_lock = asyncio.Lock()
         await self._connect_lock.acquire()
@@ -449,10 +474,8 @@ class SMTP:
         return response
 
     async def _create_connection(self, timeout: Optional[float]) -> SMTPResponse:
-        if self.loop is None:
-            raise RuntimeError("No event loop set")
-
-        protocol = SMTPProtocol(loop=self.loop)
+        loop = asyncio.get_running_loop()
+        protocol = SMTPProtocol(loop=loop)
 
         tls_context: Optional[ssl.SSLContext] = None
         ssl_handshake_timeout: Optional[float] = None
@@ -461,7 +484,7 @@ class SMTP:
             ssl_handshake_timeout = timeout
 
         if self.sock is not None:
-            connect_coro = self.loop.create_connection(
+            connect_coro = loop.create_connection(
                 lambda: protocol,
                 server_hostname=self.hostname,
                 sock=self.sock,
@@ -469,7 +492,7 @@ class SMTP:
                 ssl_handshake_timeout=ssl_handshake_timeout,
             )
         elif self.socket_path is not None:
-            connect_coro = self.loop.create_unix_connection(
+            connect_coro = loop.create_unix_connection(
                 lambda: protocol,
                 path=self.socket_path,  # type: ignore
                 ssl=tls_context,
@@ -481,7 +504,7 @@ class SMTP:
             if self.port is None:
                 raise RuntimeError("No port provided; default should have been set")
 
-            connect_coro = self.loop.create_connection(
+            connect_coro = loop.create_connection(
                 lambda: protocol,
                 host=self.hostname,
                 port=self.port,
@@ -574,23 +597,14 @@ class SMTP:
         Build an SSLContext object from the options we've been given.
         """
         if self.tls_context is not None:
-            context = self.tls_context
-        else:
-            # SERVER_AUTH is what we want for a client side socket
-            context = ssl.create_default_context(ssl.Purpose.SERVER_AUTH)
-            context.check_hostname = bool(self.validate_certs)
-            if self.validate_certs:
-                context.verify_mode = ssl.CERT_REQUIRED
-            else:
-                context.verify_mode = ssl.CERT_NONE
-
-            if self.cert_bundle is not None:
-                context.load_verify_locations(cafile=self.cert_bundle)
-
-            if self.client_cert is not None:
-                context.load_cert_chain(self.client_cert, keyfile=self.client_key)
+            return self.tls_context
 
-        return context
+        return build_tls_context(
+            validate_certs=self.validate_certs,
+            client_cert=self.client_cert,
+            client_key=self.client_key,
+            cert_bundle=self.cert_bundle,
+        )
 
     def close(self) -> None:
         """
@@ -1456,7 +1470,15 @@ class SMTP:
         )
 
     def sendmail_sync(
-        self, *args: Any, **kwargs: Any
+        self,
+        sender: str,
+        recipients: Union[str, Sequence[str]],
+        message: Union[str, bytes],
+        /,
+        *,
+        mail_options: Optional[Iterable[str]] = None,
+        rcpt_options: Optional[Iterable[str]] = None,
+        timeout: Optional[Union[float, Literal[Default.token]]] = Default.token,
     ) -> tuple[dict[str, SMTPResponse], str]:
         """
         Synchronous version of :meth:`.sendmail`. This method starts
@@ -1465,12 +1487,27 @@ class SMTP:
 
         async def sendmail_coroutine() -> tuple[dict[str, SMTPResponse], str]:
             async with self:
-                return await self.sendmail(*args, **kwargs)
+                return await self.sendmail(
+                    sender,
+                    recipients,
+                    message,
+                    mail_options=mail_options,
+                    rcpt_options=rcpt_options,
+                    timeout=timeout,
+                )
 
         return asyncio.run(sendmail_coroutine())
 
     def send_message_sync(
-        self, *args: Any, **kwargs: Any
+        self,
+        message: Union[email.message.EmailMessage, email.message.Message],
+        /,
+        *,
+        sender: Optional[str] = None,
+        recipients: Optional[Union[str, Sequence[str]]] = None,
+        mail_options: Optional[Iterable[str]] = None,
+        rcpt_options: Optional[Iterable[str]] = None,
+        timeout: Optional[Union[float, Literal[Default.token]]] = Default.token,
     ) -> tuple[dict[str, SMTPResponse], str]:
         """
         Synchronous version of :meth:`.send_message`. This method
@@ -1479,6 +1516,13 @@ class SMTP:
 
         async def send_message_coroutine() -> tuple[dict[str, SMTPResponse], str]:
             async with self:
-                return await self.send_message(*args, **kwargs)
+                return await self.send_message(
+                    message,
+                    sender=sender,
+                    recipients=recipients,
+                    mail_options=mail_options,
+                    rcpt_options=rcpt_options,
+                    timeout=timeout,
+                )
 
         return asyncio.run(send_message_coroutine())
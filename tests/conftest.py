@@ -22,7 +22,8 @@ import trustme
 from aiosmtpd.controller import Controller as SMTPDController
 from aiosmtpd.smtp import SMTP as SMTPD
 
-from aiosmtplib import SMTP, SMTPStatus
+import aiosmtplib.api
+from aiosmtplib import SMTP, SMTPStatus, clear_ssl_context_cache
 
 from .auth import DummySMTPAuth
 from .compat import cleanup_server
@@ -102,6 +103,29 @@ def debug_event_loop(
     event_loop.set_debug(previous_debug)
 
 
+@pytest.fixture(autouse=True)
+def clear_tls_context_cache() -> Generator[None, None, None]:
+    clear_ssl_context_cache()
+    yield
+    clear_ssl_context_cache()
+
+
+@pytest.fixture(scope="function")
+def built_tls_contexts(monkeypatch: pytest.MonkeyPatch) -> list[ssl.SSLContext]:
+    """Records TLS contexts built from certificate paths by ``send``."""
+    built_contexts: list[ssl.SSLContext] = []
+    original_build_tls_context = aiosmtplib.api.build_tls_context
+
+    def mock_build_tls_context(**kwargs: Any) -> ssl.SSLContext:
+        context = original_build_tls_context(**kwargs)
+        built_contexts.append(context)
+        return context
+
+    monkeypatch.setattr(aiosmtplib.api, "build_tls_context", mock_build_tls_context)
+
+    return built_contexts
+
+
 # Session scoped static values #
 
 
@@ -210,44 +234,49 @@ def server_tls_context(
     return tls_context
 
 
-@pytest.fixture(scope="function")
-def ca_cert_path(tmp_path: pathlib.Path, cert_authority: trustme.CA) -> str:
-    cert_authority.cert_pem.write_to_path(tmp_path / "ca.pem")
+@pytest.fixture(scope="session")
+def cert_dir(tmp_path_factory: pytest.TempPathFactory) -> pathlib.Path:
+    return tmp_path_factory.mktemp("certs")
 
-    return str(tmp_path / "ca.pem")
 
+@pytest.fixture(scope="session")
+def ca_cert_path(cert_dir: pathlib.Path, cert_authority: trustme.CA) -> str:
+    cert_authority.cert_pem.write_to_path(cert_dir / "ca.pem")
 
-@pytest.fixture(scope="function")
-def valid_cert_path(tmp_path: pathlib.Path, valid_client_cert: trustme.LeafCert) -> str:
+    return str(cert_dir / "ca.pem")
+
+
+@pytest.fixture(scope="session")
+def valid_cert_path(cert_dir: pathlib.Path, valid_client_cert: trustme.LeafCert) -> str:
     for pem in valid_client_cert.cert_chain_pems:
-        pem.write_to_path(tmp_path / "valid.pem", append=True)
+        pem.write_to_path(cert_dir / "valid.pem", append=True)
 
-    return str(tmp_path / "valid.pem")
+    return str(cert_dir / "valid.pem")
 
 
-@pytest.fixture(scope="function")
-def valid_key_path(tmp_path: pathlib.Path, valid_client_cert: trustme.LeafCert) -> str:
-    valid_client_cert.private_key_pem.write_to_path(tmp_path / "valid.key")
+@pytest.fixture(scope="session")
+def valid_key_path(cert_dir: pathlib.Path, valid_client_cert: trustme.LeafCert) -> str:
+    valid_client_cert.private_key_pem.write_to_path(cert_dir / "valid.key")
 
-    return str(tmp_path / "valid.key")
+    return str(cert_dir / "valid.key")
 
 
-@pytest.fixture(scope="function")
+@pytest.fixture(scope="session")
 def invalid_cert_path(
-    tmp_path: pathlib.Path, unknown_client_cert: trustme.LeafCert
+    cert_dir: pathlib.Path, unknown_client_cert: trustme.LeafCert
 ) -> str:
     for pem in unknown_client_cert.cert_chain_pems:
-        pem.write_to_path(tmp_path / "invalid.pem", append=True)
+        pem.write_to_path(cert_dir / "invalid.pem", append=True)
 
-    return str(tmp_path / "invalid.pem")
+    return str(cert_dir / "invalid.pem")
 
 
-@pytest.fixture(scope="function")
+@pytest.fixture(scope="session")
 def invalid_key_path(
-    tmp_path: pathlib.Path, unknown_client_cert: trustme.LeafCert
+    cert_dir: pathlib.Path, unknown_client_cert: trustme.LeafCert
 ) -> str:
-    unknown_client_cert.private_key_pem.write_to_path(tmp_path / "invalid.key")
-    return str(tmp_path / "invalid.key")
+    unknown_client_cert.private_key_pem.write_to_path(cert_dir / "invalid.key")
+    return str(cert_dir / "invalid.key")
 
 
 @pytest.fixture(scope="session")
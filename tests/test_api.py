@@ -4,6 +4,7 @@ send coroutine testing.
 
 import asyncio
 import email
+import os
 import pathlib
 import socket
 import ssl
@@ -11,6 +12,7 @@ from typing import Any, Union
 
 import pytest
 
+import aiosmtplib.api
 from aiosmtplib import send
 
 
@@ -131,6 +133,118 @@ async def test_send_with_start_tls(
     assert len(received_messages) == 1
 
 
+async def test_send_with_client_cert_reuses_tls_context(
+    hostname: str,
+    smtpd_server_port: int,
+    message: email.message.Message,
+    received_messages: list[email.message.EmailMessage],
+    valid_cert_path: str,
+    valid_key_path: str,
+    ca_cert_path: str,
+    built_tls_contexts: list[ssl.SSLContext],
+) -> None:
+    for _ in range(2):
+        errors, _ = await send(
+            message,
+            hostname=hostname,
+            port=smtpd_server_port,
+            start_tls=True,
+            client_cert=valid_cert_path,
+            client_key=valid_key_path,
+            cert_bundle=ca_cert_path,
+        )
+        assert not errors
+
+    assert len(received_messages) == 2
+    assert len(built_tls_contexts) == 1
+
+    aiosmtplib.clear_ssl_context_cache()
+    errors, _ = await send(
+        message,
+        hostname=hostname,
+        port=smtpd_server_port,
+        start_tls=True,
+        client_cert=valid_cert_path,
+        client_key=valid_key_path,
+        cert_bundle=ca_cert_path,
+    )
+
+    assert not errors
+    assert len(built_tls_contexts) == 2
+
+
+async def test_send_with_modified_client_cert_rebuilds_tls_context(
+    hostname: str,
+    smtpd_server_port: int,
+    message: email.message.Message,
+    valid_cert_path: str,
+    valid_key_path: str,
+    ca_cert_path: str,
+    tmp_path: pathlib.Path,
+    built_tls_contexts: list[ssl.SSLContext],
+) -> None:
+    cert_path = tmp_path / "client.pem"
+    cert_path.write_bytes(pathlib.Path(valid_cert_path).read_bytes())
+
+    for _ in range(2):
+        errors, _ = await send(
+            message,
+            hostname=hostname,
+            port=smtpd_server_port,
+            start_tls=True,
+            client_cert=str(cert_path),
+            client_key=valid_key_path,
+            cert_bundle=ca_cert_path,
+        )
+        assert not errors
+
+    assert len(built_tls_contexts) == 1
+
+    mtime_ns = cert_path.stat().st_mtime_ns + 1_000_000_000
+    os.utime(cert_path, ns=(mtime_ns, mtime_ns))
+
+    errors, _ = await send(
+        message,
+        hostname=hostname,
+        port=smtpd_server_port,
+        start_tls=True,
+        client_cert=str(cert_path),
+        client_key=valid_key_path,
+        cert_bundle=ca_cert_path,
+    )
+
+    assert not errors
+    assert len(built_tls_contexts) == 2
+    assert built_tls_contexts[0] is not built_tls_contexts[1]
+
+
+@pytest.mark.smtpd_options(starttls=False)
+async def test_send_opportunistic_tls_does_not_load_certs(
+    hostname: str,
+    smtpd_server_port: int,
+    recipient_str: str,
+    sender_str: str,
+    message_str: str,
+    received_messages: list[email.message.EmailMessage],
+    tmp_path: pathlib.Path,
+    built_tls_contexts: list[ssl.SSLContext],
+) -> None:
+    errors, _ = await send(
+        message_str,
+        hostname=hostname,
+        port=smtpd_server_port,
+        sender=sender_str,
+        recipients=[recipient_str],
+        client_cert=str(tmp_path / "missing.pem"),
+        client_key=str(tmp_path / "missing.key"),
+        cert_bundle=str(tmp_path / "missing-ca.pem"),
+    )
+
+    assert not errors
+    assert len(received_messages) == 1
+    assert not built_tls_contexts
+
+
 async def test_send_with_login(
     hostname: str,
     smtpd_server_port: int,
@@ -0,0 +1,212 @@
+"""
+SMTPConnectionPool testing.
+"""
+
+import asyncio
+import email.message
+from typing import Any
+
+import pytest
+from aiosmtpd.smtp import SMTP as SMTPD
+
+from aiosmtplib import SMTP, SMTPConnectionPool, SMTPTimeoutError, send
+
+
+async def test_pool_reuses_connection(
+    hostname: str,
+    smtpd_server_port: int,
+    message: email.message.Message,
+    received_messages: list[email.message.EmailMessage],
+    received_commands: list[tuple[str, tuple[Any, ...]]],
+) -> None:
+    async with SMTPConnectionPool() as pool:
+        for _ in range(3):
+            errors, _ = await send(
+                message,
+                hostname=hostname,
+                port=smtpd_server_port,
+                start_tls=False,
+                pool=pool,
+            )
+            assert not errors
+
+    commands = [command[0] for command in received_commands]
+    assert len(received_messages) == 3
+    assert commands.count("EHLO") == 1
+    assert commands.count("RSET") == 3
+    assert commands.count("QUIT") == 1
+
+
+async def test_pool_acquire_release(
+    hostname: str,
+    smtpd_server_port: int,
+) -> None:
+    pool = SMTPConnectionPool()
+
+    client = await pool.acquire(
+        hostname=hostname, port=smtpd_server_port, start_tls=False
+    )
+    assert client.is_connected
+    await pool.release(client)
+
+    same_client = await pool.acquire(
+        hostname=hostname, port=smtpd_server_port, start_tls=False
+    )
+    assert same_client is client
+
+    other_client = await pool.acquire(
+        hostname=hostname, port=smtpd_server_port, start_tls=False
+    )
+    assert other_client is not client
+
+    await pool.release(same_client)
+    await pool.release(other_client)
+    await pool.close()
+
+    assert not client.is_connected
+    assert not other_client.is_connected
+
+
+async def test_pool_discards_disconnected_client(
+    hostname: str,
+    smtpd_server_port: int,
+) -> None:
+    async with SMTPConnectionPool() as pool:
+        client = await pool.acquire(
+            hostname=hostname, port=smtpd_server_port, start_tls=False
+        )
+        await pool.release(client)
+        client.close()
+
+        new_client = await pool.acquire(
+            hostname=hostname, port=smtpd_server_port, start_tls=False
+        )
+        assert new_client is not client
+        assert new_client.is_connected
+
+        await pool.release(new_client)
+
+
+async def test_pool_max_idle(
+    hostname: str,
+    smtpd_server_port: int,
+) -> None:
+    async with SMTPConnectionPool(max_idle=1) as pool:
+        client1 = await pool.acquire(
+            hostname=hostname, port=smtpd_server_port, start_tls=False
+        )
+        client2 = await pool.acquire(
+            hostname=hostname, port=smtpd_server_port, start_tls=False
+        )
+
+        await pool.release(client1)
+        await pool.release(client2)
+
+        assert client1.is_connected
+        assert not client2.is_connected
+
+
+async def test_pool_release_discard(
+    hostname: str,
+    smtpd_server_port: int,
+) -> None:
+    async with SMTPConnectionPool() as pool:
+        client = await pool.acquire(
+            hostname=hostname, port=smtpd_server_port, start_tls=False
+        )
+        await pool.release(client, discard=True)
+
+        assert not client.is_connected
+        with pytest.raises(ValueError):
+            await pool.release(client)
+
+
+async def test_send_with_pool_discards_client_after_timeout(
+    hostname: str,
+    smtpd_server_port: int,
+    message: email.message.Message,
+    received_messages: list[email.message.EmailMessage],
+    received_commands: list[tuple[str, tuple[Any, ...]]],
+    smtpd_class: type[SMTPD],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    # Respond after the client times out, but before a following command would
+    async def mock_response_slow_data(smtpd: SMTPD, *args: Any, **kwargs: Any) -> None:
+        await asyncio.sleep(0.15)
+        await smtpd.push("250 all done")
+
+    async with SMTPConnectionPool() as pool:
+        with monkeypatch.context() as patch:
+            patch.setattr(smtpd_class, "smtp_DATA", mock_response_slow_data)
+
+            with pytest.raises(SMTPTimeoutError):
+                await send(
+                    message,
+                    hostname=hostname,
+                    port=smtpd_server_port,
+                    start_tls=False,
+                    timeout=0.1,
+                    pool=pool,
+                )
+
+        errors, _ = await send(
+            message,
+            hostname=hostname,
+            port=smtpd_server_port,
+            start_tls=False,
+            timeout=0.1,
+            pool=pool,
+        )
+
+    commands = [command[0] for command in received_commands]
+    assert not errors
+    assert len(received_messages) == 1
+    assert commands.count("EHLO") == 2
+    assert "RSET" not in commands[: commands.index("EHLO", 1)]
+
+
+async def test_pool_close_with_concurrent_acquire(
+    hostname: str,
+    smtpd_server_port: int,
+) -> None:
+    pool = SMTPConnectionPool()
+
+    client = await pool.acquire(
+        hostname=hostname, port=smtpd_server_port, start_tls=False
+    )
+    await pool.release(client)
+
+    _, other_client = await asyncio.gather(
+        pool.close(),
+        pool.acquire(
+            hostname=hostname, port=smtpd_server_port, start_tls=False, timeout=2.0
+        ),
+    )
+    await pool.release(other_client)
+    await pool.close()
+
+    assert not client.is_connected
+    assert not other_client.is_connected
+
+
+async def test_pool_release_unknown_client_raises(
+    hostname: str,
+    smtpd_server_port: int,
+) -> None:
+    pool = SMTPConnectionPool()
+
+    with pytest.raises(ValueError):
+        await pool.release(SMTP(hostname=hostname, port=smtpd_server_port))
+
+
+async def test_pool_invalid_max_idle_raises() -> None:
+    with pytest.raises(ValueError):
+        SMTPConnectionPool(max_idle=0)
+
+
+async def test_send_with_pool_and_sock_raises(
+    message: email.message.Message,
+) -> None:
+    async with SMTPConnectionPool() as pool:
+        with pytest.raises(ValueError):
+            await send(message, sock=object(), pool=pool)  # type: ignore
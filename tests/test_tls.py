@@ -2,7 +2,6 @@
 TLS and STARTTLS handling.
 """
 
-import copy
 import ssl
 from collections.abc import Callable
 
@@ -192,7 +191,7 @@ async def test_starttls_invalid_responses(
     async with smtp_client:
         await smtp_client.ehlo()
 
-        old_extensions = copy.copy(smtp_client.esmtp_extensions)
+        old_extensions = smtp_client.esmtp_extensions.copy()
 
         with pytest.raises(SMTPResponseException) as exception_info:
             await smtp_client.starttls()